@@ -8,19 +8,23 @@ Tkinter-based interface.
 
 Key Architectural Decisions:
 ---------------------------
-1. Single Instance Policy: Uses a local TCP socket to ensure only one instance
-   of the application runs at a time.
-2. Responsive Initialization: Implements a background import system for large
-   dependencies (yt-dlp) to ensure the UI renders instantly upon launch.
+1. Single Instance Policy: Uses a platform-specific lock (abstract UNIX socket,
+   flock, or a Windows named mutex) to ensure only one instance of the
+   application runs at a time.
+2. Responsive Initialization: Large dependencies (yt-dlp) are bound through a
+   lazy module proxy, so the UI renders instantly while a background thread
+   started at launch performs the real import.
 3. Cross-Platform Consistency: Custom widget drawing is used to bypass macOS
    native styling limitations, ensuring a premium look on all platforms.
 4. Integrated Binary Management: Bundles platform-specific ffmpeg binaries
    for post-processing (e.g., merging video and audio).
 """
 
-import os, sys, shutil, threading, re, socket, tkinter as tk
-from tkinter import filedialog, messagebox
-import subprocess, json, urllib.request, webbrowser, time, ssl
+import os, sys, threading, queue, re, socket, time, functools, collections, importlib.util, tkinter as tk
+# Note: subprocess, json, ssl, urllib.request, webbrowser and the tkinter
+# dialog modules are imported at their point of use. They are only needed
+# on user action (update check, folder open, dialogs), so deferring them
+# keeps them off the cold-start path before the first window paints.
 
 # --- Application Identification and Update Configuration ---
 APP_VERSION = '2.0.1'
@@ -38,45 +42,126 @@ GLOBAL_USER_AGENT = (
     'Chrome/122.0.0.0 Safari/537.36'
 )
 
+# --- Input Validation ---
+# Compiled once at import so every URL submitted (single video or playlist)
+# is checked with a single regex scan instead of ad-hoc string operations.
+_YT_URL_RE = re.compile(
+    r'^(?:https?://)?(?:[\w-]+\.)*(?:youtube\.com|youtube-nocookie\.com|youtu\.be)/\S+$',
+    re.IGNORECASE | re.ASCII) # Host names are ASCII; skip Unicode class tables
+# Extracts the 11-character video ID from watch, short-link, Shorts and embed URLs;
+# only applied to text _YT_URL_RE accepts. The lookahead rejects longer IDs
+# instead of truncating them into a valid-looking one.
+_YT_ID_RE = re.compile(r'(?:[?&]v=|youtu\.be/|shorts/|embed/)([A-Za-z0-9_-]{11})(?![A-Za-z0-9_-])')
+# Strips terminal color codes from yt-dlp's formatted output strings
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*m')
+# Friendly wording for common yt-dlp failures; first match wins
+_ERR_MAP = (
+    (re.compile(r'Incomplete YouTube ID'), 'Invalid YouTube URL provided.'),
+    (re.compile(r'requested format not available', re.I),
+     'The selected resolution is not available for this video.'),
+    (re.compile(r'Requested .* is not available'), 'Partial format missing. Try a lower quality.'),
+)
+
+def _first_url(text):
+    """
+    Returns the first whitespace-separated token of text ('' if none).
+    A multi-line clipboard paste validates and downloads its first link.
+    """
+    parts = text.split(None, 1)
+    return parts[0] if parts else ''
+
+
 # --- Single Instance Lock Persistence ---
 # To prevent data corruption or UI confusion, we only allow one copy of the 
-# app to run. We attempt to bind a local socket to port 47216. If binding
-# fails, it means another instance of this application is already active.
-_LOCK_PORT = 47216
+# app to run. The lock primitive is chosen per platform:
+#   Linux   -> abstract-namespace UNIX socket (no file, no TCP port)
+#   macOS   -> exclusive flock() on a file in Application Support
+#   Windows -> named mutex in the session namespace (no port, no firewall prompt)
+#   Other   -> exclusive flock() on a file in ~/.cache/ytdl
+# If the lock cannot be claimed, another instance is already active.
+_LOCK_NAME = 'faysal.ytdl.lock'
+_BUNDLE_ID = 'faysal.ytdl.app.pro.v1' # macOS bundle identifier, see build.py
 _lock_sock = None
+_lock_mutex = None # Windows mutex handle; released by the OS on exit
 
 def _acquire_single_instance():
     """
-    Attempts to create a persistent lock on a local port.
+    Attempts to create a persistent, process-lifetime instance lock.
     Returns:
         bool: True if this instance successfully claimed the lock, 
               False if another instance is already running.
     """
-    global _lock_sock
+    global _lock_sock, _lock_mutex
     try:
-        _lock_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        # Prevent the port from staying in TIME_WAIT state
-        _lock_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 0)
-        _lock_sock.bind(('127.0.0.1', _LOCK_PORT))
+        if sys.platform.startswith('linux'):
+            # Abstract socket names vanish automatically when the process exits
+            _lock_sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            _lock_sock.bind('\0' + _LOCK_NAME)
+        elif sys.platform == 'darwin':
+            import fcntl
+            lock_dir = os.path.expanduser('~/Library/Application Support/YT Downloader')
+            os.makedirs(lock_dir, exist_ok=True)
+            _lock_sock = open(os.path.join(lock_dir, _LOCK_NAME), 'w')
+            fcntl.flock(_lock_sock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        elif sys.platform == 'win32':
+            import ctypes
+            from ctypes import wintypes
+            kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+            kernel32.CreateMutexW.restype  = wintypes.HANDLE
+            kernel32.CreateMutexW.argtypes = [ctypes.c_void_p, wintypes.BOOL, wintypes.LPCWSTR]
+            _lock_mutex = kernel32.CreateMutexW(None, True, 'Local\\' + _LOCK_NAME)
+            # 183 = ERROR_ALREADY_EXISTS: another instance created it first
+            return bool(_lock_mutex) and ctypes.get_last_error() != 183
+        else:
+            import fcntl
+            lock_dir = os.path.join(os.path.expanduser('~'), '.cache', 'ytdl')
+            os.makedirs(lock_dir, exist_ok=True)
+            _lock_sock = open(os.path.join(lock_dir, _LOCK_NAME), 'w')
+            fcntl.flock(_lock_sock, fcntl.LOCK_EX | fcntl.LOCK_NB)
         return True
     except OSError:
         return False
 
+def _activate_running_instance():
+    """
+    Brings the already-running macOS instance to the foreground.
+    
+    RATIONALE:
+    Spawning 'osascript' forks a process and boots an AppleScript interpreter
+    (~100 ms). When pyobjc is available we ask AppKit directly instead. Both
+    paths address the app by its bundle identifier (set by build.py), so they
+    do not depend on the bundle's display name.
+    """
+    try:
+        from AppKit import NSRunningApplication
+        for a in NSRunningApplication.runningApplicationsWithBundleIdentifier_(_BUNDLE_ID):
+            if a.processIdentifier() != os.getpid():
+                # 1 << 1 = NSApplicationActivateIgnoringOtherApps
+                a.activateWithOptions_(1 << 1)
+                return
+    except Exception:
+        pass
+    try:
+        import subprocess
+        subprocess.run(['osascript', '-e',
+            f'tell application id "{_BUNDLE_ID}" to activate'], check=False)
+    except Exception:
+        pass
+
 # --- Instance Check and Activation ---
 if not _acquire_single_instance():
     # If we are on macOS and an instance is already running, we try to 
     # bring that existing instance to the foreground before exiting.
     if sys.platform == 'darwin':
-        try:
-            subprocess.run(['osascript', '-e',
-                'tell application "YT Downloader" to activate'], check=False)
-        except Exception:
-            pass
+        _activate_running_instance()
     try:
-        # Create a hidden dummy root to show the information dialog
+        # Create a hidden dummy root to show the information dialog. Tk's own
+        # tk_messageBox is called directly; tkinter.messagebox is not needed.
         _r = tk.Tk(); _r.withdraw()
-        messagebox.showinfo('Already Running',
-            'YouTube Downloader is already open.\nPlease check your Dock or taskbar for the active window.')
+        _r.tk.call('tk_messageBox', '-type', 'ok', '-icon', 'info',
+                   '-title', 'Already Running',
+                   '-message', 'YouTube Downloader is already open.\n'
+                               'Please check your Dock or taskbar for the active window.')
         _r.destroy()
     except Exception:
         pass
@@ -117,6 +202,16 @@ def get_app_dir():
         return os.path.dirname(sys.executable)
     return os.path.dirname(os.path.abspath(__file__))
 
+# Entries already on PATH, so prepending is an O(1) membership check
+_PATH_SET = set(filter(None, os.environ.get('PATH', '').split(os.pathsep)))
+
+def _prepend_path(d):
+    """Puts d at the front of PATH unless it is already listed."""
+    if d in _PATH_SET:
+        return
+    _PATH_SET.add(d)
+    os.environ['PATH'] = os.pathsep.join(filter(None, (d, os.environ.get('PATH', ''))))
+
 def setup_ffmpeg():
     """
     Locates the bundled ffmpeg binaries and adds them to the system PATH.
@@ -129,17 +224,76 @@ def setup_ffmpeg():
     if not os.path.isdir(d):
         d = res('ffmpeg_bin')
         
+    # PATH is extended exactly once, here. Any JS runtime we use is either
+    # bundled in this same folder or was found on PATH already.
     if os.path.isdir(d):
-        os.environ['PATH'] = d + os.pathsep + os.environ.get('PATH', '')
+        _prepend_path(d)
     return d
 
 FFMPEG_DIR = setup_ffmpeg()
 
-# Note: yt_dlp is imported lazily in a background thread later.
-# This prevents the initial UI window from hanging while Python compiles
-# the large yt_dlp module hierarchy.
-yt_dlp     = None
-HAVE_YTDLP = False
+def _scan_bin_dir(d):
+    """
+    Lists the regular files in the bundled binaries folder with a single
+    directory read, so later lookups need no per-file stat calls.
+    Returns:
+        dict: File name -> absolute path (empty if the folder is missing).
+    """
+    try:
+        with os.scandir(d) as it:
+            return {e.name: os.path.abspath(e.path) for e in it if e.is_file()}
+    except OSError:
+        return {}
+
+_FFMPEG_FILES = _scan_bin_dir(FFMPEG_DIR)
+
+@functools.lru_cache(maxsize=1)
+def _has_ffmpeg():
+    """
+    Reports whether ffmpeg is available, bundled or on the system PATH.
+    Checked once per process; call _has_ffmpeg.cache_clear() to re-probe.
+    """
+    exe = 'ffmpeg.exe' if sys.platform == 'win32' else 'ffmpeg'
+    if exe in _FFMPEG_FILES:
+        return True
+    return any(os.path.isfile(os.path.join(d, exe))
+               for d in os.environ.get('PATH', '').split(os.pathsep) if d)
+
+def _lazy_import(name):
+    """
+    Binds a module through importlib's LazyLoader.
+
+    RATIONALE:
+    yt-dlp has a massive dependency tree and complex monkeypatching logic.
+    Importing it eagerly takes 1-3 seconds. The returned proxy only resolves
+    the module spec up front; the real import runs on first attribute access,
+    which App._warm_engine makes on its own thread.
+
+    Returns:
+        module | None: The lazy module proxy, or None if it is not installed.
+    """
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or spec.loader is None:
+        return None
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+# Note: yt_dlp is a lazy proxy. This prevents the initial UI window from
+# hanging while Python compiles the large yt_dlp module hierarchy.
+# INVARIANT: LazyLoader is not thread-safe before Python 3.12; two threads
+# touching the proxy during its first load can see a half-initialised
+# module. Only App._warm_engine may access it before App._engine_ready is
+# set; every other thread (including anything importing yt_dlp_ejs, which
+# imports yt_dlp) must wait on that event first.
+yt_dlp     = _lazy_import('yt_dlp')
+HAVE_YTDLP = yt_dlp is not None
 
 # --- Visual Design System ---
 QUALITIES  = ['best','4320p','2160p','1440p','1080p','720p','480p','360p','240p','144p']
@@ -187,30 +341,22 @@ BTN_GHOST_HOV    = '#363650'
 BTN_GHOST_HOV_FG = '#FFFFFF'
 
 # --- Typography Configuration ---
-import tkinter.font as tkfont
-_FAMILIES = []
-
-def _ff(*names):
-    """
-    Selects the first available font family from a prioritized list.
-    Ensures consistent looks across Windows (Segoe UI), macOS (SF Pro), and Linux.
-    """
-    global _FAMILIES
-    if not _FAMILIES:
-        try: _FAMILIES = list(tkfont.families())
-        except: _FAMILIES = []
-    for n in names:
-        if n in _FAMILIES: return n
-    return names[-1]
+# The preferred faces are fully determined by the platform, so they are baked
+# in rather than validated against tkfont.families() (a slow enumeration of
+# every installed font). Tk silently substitutes its default for a missing face.
+_PLAT_FONTS = {
+    'win32':  {'ui': 'Segoe UI',    'display': 'Segoe UI',       'mono': 'Consolas'},
+    'darwin': {'ui': 'SF Pro Text', 'display': 'SF Pro Display', 'mono': 'Menlo'},
+}.get(sys.platform, {'ui': 'Helvetica', 'display': 'Helvetica', 'mono': 'Courier New'})
 
 # Defined font styles for different UI elements
-F_DISPLAY = (_ff('Segoe UI','SF Pro Display','Helvetica Neue','Helvetica'), 16, 'bold')
-F_BODY    = (_ff('Segoe UI','SF Pro Text',   'Helvetica Neue','Helvetica'), 12)
-F_MONO    = (_ff('Cascadia Code','Consolas','Menlo','Courier New'), 11)
-F_MONO_S  = (_ff('Cascadia Code','Consolas','Menlo','Courier New'), 11)
-F_LABEL   = (_ff('Segoe UI','SF Pro Text',   'Helvetica Neue','Helvetica'), 10, 'bold')
-F_BTN     = (_ff('Segoe UI','SF Pro Text',   'Helvetica Neue','Helvetica'), 11, 'bold')
-F_BTN_LG  = (_ff('Segoe UI','SF Pro Text',   'Helvetica Neue','Helvetica'), 13, 'bold')
+F_DISPLAY = (_PLAT_FONTS['display'], 16, 'bold')
+F_BODY    = (_PLAT_FONTS['ui'],      12)
+F_MONO    = (_PLAT_FONTS['mono'],    11)
+F_MONO_S  = (_PLAT_FONTS['mono'],    11)
+F_LABEL   = (_PLAT_FONTS['ui'],      10, 'bold')
+F_BTN     = (_PLAT_FONTS['ui'],      11, 'bold')
+F_BTN_LG  = (_PLAT_FONTS['ui'],      13, 'bold')
 
 
 # --- High-Level UI Component Factories ---
@@ -218,105 +364,63 @@ F_BTN_LG  = (_ff('Segoe UI','SF Pro Text',   'Helvetica Neue','Helvetica'), 13,
 def make_btn(parent, text, cmd, bg, fg, hover_bg=None, hover_fg=None,
              font=None, padx=14, pady=8, **kw):
     """
-    Creates a custom button-like widget using nested Frames and a Label.
+    Creates a custom button-like widget from a single Label.
     
     RATIONALE:
     Standard tkinter.Button widgets on macOS are heavily restricted by the 
     system's native 'Aqua' theme, preventing custom background colors.
-    This composite widget bypasses those restrictions, allowing for a fully 
+    This widget bypasses those restrictions, allowing for a fully 
     branded experience while maintaining accessibility and hover effects.
+    A Label sizes and centres its own text, so each button is one widget
+    with three bindings and no font measuring or <Configure> handling.
     """
     hbg = hover_bg or bg
     hfg = hover_fg or fg
 
-    # Outer frame acts as the border/hit-area
-    outer = tk.Frame(parent, bg=bg, cursor='hand2', padx=2, pady=2)
-    # Inner frame acts as the button body
-    inner = tk.Frame(outer, bg=bg, cursor='hand2')
-    inner.pack(fill='both', expand=True)
-    # Label provides the text and internal padding
-    lbl = tk.Label(inner, text=text, bg=bg, fg=fg,
-                   font=font or F_BTN, padx=padx, pady=pady,
-                   cursor='hand2')
-    lbl.pack(fill='both', expand=True)
+    # The extra 2px reproduces the border/hit-area padding of the old frame
+    lbl = tk.Label(parent, text=text, bg=bg, fg=fg, font=font or F_BTN,
+                   padx=padx + 2, pady=pady + 2, cursor='hand2',
+                   bd=0, highlightthickness=0)
+    flags = {'enabled': True}
 
     def _on(e):
         """Applies hover states."""
-        outer.config(bg=hbg); inner.config(bg=hbg); lbl.config(bg=hbg, fg=hfg)
+        if flags['enabled']:
+            lbl.configure(bg=hbg, fg=hfg)
     def _off(e):
         """Restores default states."""
-        outer.config(bg=bg);  inner.config(bg=bg);  lbl.config(bg=bg,  fg=fg)
+        if flags['enabled']:
+            lbl.configure(bg=bg, fg=fg)
     def _click(e):
-        """Handles the click event with a brief visual feedback delay."""
-        _on(e)
-        outer.after(80, cmd)
-
-    # Bind interactions to all constituent parts
-    for w in (outer, inner, lbl):
-        w.bind('<Enter>',           _on)
-        w.bind('<Leave>',           _off)
-        w.bind('<ButtonRelease-1>', _click)
+        """Handles the click event once the hover state has been painted."""
+        if flags['enabled']:
+            _on(e)
+            lbl.after_idle(cmd)
 
-    # Internal reference to the original Frame.config method
-    _outer_config = outer.config.__func__ 
+    lbl.bind('<Enter>',           _on)
+    lbl.bind('<Leave>',           _off)
+    lbl.bind('<ButtonRelease-1>', _click)
 
-    def _cfg(**opts):
+    def set_state(state=None, bg=None, fg=None):
         """
-        Custom configuration wrapper to handle 'state', 'bg', and 'fg' 
-        for the entire composite component.
+        Enables/disables the button and recolors it. Plain options such as
+        'text' go through the Label's own config(), which is left untouched.
         """
-        s      = opts.pop('state', None)
-        new_bg = opts.pop('bg',    None)
-        new_fg = opts.pop('fg',    None)
-        
-        if s == 'disabled':
-            for w in (outer, inner, lbl):
-                w.unbind('<Enter>'); w.unbind('<Leave>'); w.unbind('<ButtonRelease-1>')
+        if state == 'disabled':
+            flags['enabled'] = False
             lbl.configure(fg=FG3) # Use dim text for disabled state
-        elif s == 'normal':
-            for w in (outer, inner, lbl):
-                w.bind('<Enter>',           _on)
-                w.bind('<Leave>',           _off)
-                w.bind('<ButtonRelease-1>', _click)
+        elif state == 'normal':
+            flags['enabled'] = True
         
-        if new_bg:
-            # Configure all backgrounds to match
-            outer.configure(bg=new_bg)
-            inner.configure(bg=new_bg)
-            lbl.configure(bg=new_bg)
-        if new_fg:
-            lbl.configure(fg=new_fg)
-
-    # Override the config method of the outer frame
-    outer.config = _cfg
-    return outer
-
-def BG3_SAFE(): return CARD
+        if bg:
+            lbl.configure(bg=bg)
+        if fg:
+            lbl.configure(fg=fg)
 
+    lbl.set_state = set_state
+    return lbl
 
-# --- Background Tasks ---
-# --- Asynchronous Dependency Management ---
-
-def _import_yt_dlp_async(on_done):
-    """
-    Imports the 'yt_dlp' module in a background thread.
-    
-    RATIONALE:
-    yt-dlp has a massive dependency tree and complex monkeypatching logic. 
-    Importing it on the main thread takes 1-3 seconds, which feels laggy.
-    By importing it asynchronously, we can show a splash screen and animate 
-    the UI while the engine loads.
-    """
-    global yt_dlp, HAVE_YTDLP
-    try:
-        import yt_dlp as _yd
-        yt_dlp     = _yd
-        HAVE_YTDLP = True
-    except ImportError:
-        HAVE_YTDLP = False
-    
-    # Notify the main thread that we are finished
-    on_done()
+def BG3_SAFE(): return CARD
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -324,78 +428,248 @@ def _import_yt_dlp_async(on_done):
 # ══════════════════════════════════════════════════════════════════════════════
 # --- Video Extraction Challenge Helpers (JS Runtimes) ---
 
+# The last system runtime found on PATH, so later launches skip the scan
+JS_RUNTIME_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'ytdl', 'js_runtime.json')
+_JS_RUNTIMES = ('node', 'deno', 'bun') # Preference order
+
+@functools.lru_cache(maxsize=1)
 def _find_js_runtime():
     """
     Scans for an available JavaScript runtime (Node, Deno, or Bun).
     
     Some YouTube videos use 'signature scrambling' or extraction logic that 
     requires a JS engine to solve. We bundle Deno/Node for this purpose.
+    The scan runs once per process; the result is memoized.
+
+    RATIONALE: Looking a runtime up on PATH stats every PATH entry per
+    candidate name. The winner is persisted to JS_RUNTIME_CACHE_FILE and
+    reused on later launches for as long as the file still exists.
     """
+    exe = '.exe' if sys.platform == 'win32' else ''
+
     # Priority: Bundled runtime > System path
-    for r in ['node.exe','node','deno.exe','deno','bun.exe','bun']:
-        p = os.path.join(FFMPEG_DIR, r)
-        if os.path.isfile(p):
-            name = 'node' if 'node' in r else ('deno' if 'deno' in r else 'bun')
-            return name, os.path.abspath(p)
-        
-        # Fallback to checking the user's system
-        w = shutil.which(r)
-        if w:
-            name = 'node' if 'node' in r else ('deno' if 'deno' in r else 'bun')
-            return name, os.path.abspath(w)
+    for name in _JS_RUNTIMES:
+        p = _FFMPEG_FILES.get(name + exe)
+        if p:
+            return name, p
+
+    loads, dumps = _json_codec()
+    try:
+        with open(JS_RUNTIME_CACHE_FILE, 'rb') as f:
+            cached = loads(f.read())
+        if cached['name'] in _JS_RUNTIMES and os.path.isfile(cached['path']):
+            return cached['name'], cached['path']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    # Fallback to checking the user's system; PATH is split only once and
+    # repeated entries (common on Windows) are stat'ed only once per name
+    dirs = [d for d in dict.fromkeys(os.environ.get('PATH', '').split(os.pathsep)) if d]
+    for name in _JS_RUNTIMES:
+        for d in dirs:
+            p = os.path.join(d, name + exe)
+            if os.path.isfile(p) and os.access(p, os.X_OK):
+                p = os.path.abspath(p)
+                try:
+                    os.makedirs(os.path.dirname(JS_RUNTIME_CACHE_FILE), exist_ok=True)
+                    with open(JS_RUNTIME_CACHE_FILE, 'wb') as f:
+                        f.write(dumps({'name': name, 'path': p}))
+                except OSError:
+                    pass
+                return name, p
     return None, None
 
+_EJS_READY = threading.Event()   # set once the solver check below has run
+_ejs_lock = threading.Lock()
+_ejs_ok = False
+
 def _ensure_ejs_installed():
     """
     Auto-installs 'yt-dlp-ejs' if missing. This is a helper plugin 
     that allows yt-dlp to solve modern YouTube challenges.
+
+    RATIONALE: The import probe and pip fallback run once per process;
+    later downloads get the memoized result without touching the disk.
+    Returns True when the solver is importable.
     """
-    try:
-        import importlib; importlib.import_module('yt_dlp_ejs')
-    except ImportError:
+    global _ejs_ok
+    if _EJS_READY.is_set():
+        return _ejs_ok
+    with _ejs_lock:
+        if _EJS_READY.is_set():
+            return _ejs_ok
+        import importlib
         try:
-            # Silent background install
-            subprocess.run([sys.executable,'-m','pip','install','--quiet','yt-dlp-ejs'],
-                           check=True, capture_output=True, timeout=60)
-        except Exception: 
-            pass
+            importlib.import_module('yt_dlp_ejs')
+            _ejs_ok = True
+        except ImportError:
+            try:
+                # Silent background install
+                import subprocess
+                subprocess.run([sys.executable,'-m','pip','install','--quiet','yt-dlp-ejs'],
+                               check=True, capture_output=True, timeout=60)
+                importlib.invalidate_caches()
+                importlib.import_module('yt_dlp_ejs')
+                _ejs_ok = True
+            except Exception: 
+                pass
+        _EJS_READY.set()
+    return _ejs_ok
+
+_runtime_opts_cache = None
 
 def _get_runtime_opts():
     """
     Constructs the yt-dlp options required to enable external JS extraction.
+    Computed on first use and cached; each caller receives its own copy.
     """
+    global _runtime_opts_cache
+    if _runtime_opts_cache is None:
+        _runtime_opts_cache = _compute_runtime_opts()
+    return dict(_runtime_opts_cache)
+
+def _compute_runtime_opts():
+    """Resolves the JS runtime and translates it into yt-dlp options."""
     if not HAVE_YTDLP: return {}
     
     name, path = _find_js_runtime()
     if not name or not path: return {}
 
-    # Add the runtime's directory to PATH so subprocesses can find it
-    rdir = os.path.dirname(path)
-    if rdir not in os.environ.get('PATH',''):
-        os.environ['PATH'] = rdir + os.pathsep + os.environ.get('PATH','')
+    # Inform yt-dlp which JS engine to use, by absolute path: a runtime
+    # remembered from an earlier session need not be on the current PATH.
+    # Newer releases also accept the remote components flag; try the full
+    # set in a single parse and only re-parse without it if this yt-dlp
+    # rejects the flag.
+    cli_args = ['--js-runtimes', f'{name}:{path}']
+    parsed = None
+    for args in (cli_args + ['--remote-components','ejs:github'], cli_args):
+        try:
+            _, _, _, parsed = yt_dlp.parse_options(args)
+            break
+        except (SystemExit, Exception):
+            continue
+    if parsed is None:
+        return {}
+
+    return {k: parsed[k] for k in ('js_runtimes','remote_components')
+            if parsed.get(k) is not None}
+
+# --- Update Manifest Retrieval ---
+
+# The last manifest and its ETag are kept so unchanged manifests can be
+# revalidated with a conditional GET (304, no body) instead of re-downloaded.
+UPDATE_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'ytdl', 'update.json')
 
+def _json_codec():
+    """
+    Returns a (loads, dumps) pair, preferring orjson when it is installed.
+    Both loads accept bytes; dumps always returns UTF-8 bytes.
+    """
+    try:
+        import orjson
+        return orjson.loads, orjson.dumps
+    except ImportError:
+        import json
+        return json.loads, lambda obj: json.dumps(obj).encode('utf-8')
+
+def _fetch_update_manifest():
+    """
+    Downloads and decodes the remote version.json manifest.
+    The networking and JSON modules are imported here rather than at the
+    top of the file since they are only needed once the UI is up.
+    """
+    import ssl, urllib.request, urllib.error
+    loads, dumps = _json_codec()
+    ctx = ssl.create_default_context()
+    ctx.check_hostname = False
+    ctx.verify_mode = ssl.CERT_NONE
+
+    cached = None
     try:
-        # Inform yt-dlp which JS engine to use
-        cli_args = ['--js-runtimes', name]
+        with open(UPDATE_CACHE_FILE, 'rb') as f:
+            cached = loads(f.read())
+    except (OSError, ValueError):
+        pass
+
+    headers = {
+        'User-Agent': GLOBAL_USER_AGENT,
+        'Cache-Control': 'no-cache',
+        'Accept-Encoding': 'gzip',
+    }
+    if cached and cached.get('etag'):
+        headers['If-None-Match'] = cached['etag']
+    if cached and cached.get('last_modified'):
+        headers['If-Modified-Since'] = cached['last_modified']
+
+    url_no_cache = f"{UPDATE_CHECK_URL}?t={int(time.time())}"
+    req = urllib.request.Request(url_no_cache, headers=headers)
+    try:
+        # Closing the response releases the socket as soon as the body is read
+        with urllib.request.urlopen(req, timeout=3, context=ctx) as resp:
+            body     = resp.read()
+            gzipped  = resp.headers.get('Content-Encoding') == 'gzip'
+            etag     = resp.headers.get('ETag')
+            last_mod = resp.headers.get('Last-Modified')
+    except urllib.error.HTTPError as e:
+        # 304 Not Modified: the cached manifest is still current
+        if e.code == 304 and cached:
+            return cached['data']
+        raise
+    if gzipped:
+        import gzip
+        body = gzip.decompress(body)
+    data = loads(body) # Parsed straight from bytes, no str round-trip
+
+    if etag or last_mod:
         try:
-            # If the remote components plugin is present, use it
-            yt_dlp.parse_options(['--remote-components','ejs:github'])
-            cli_args += ['--remote-components','ejs:github']
-        except Exception: 
+            os.makedirs(os.path.dirname(UPDATE_CACHE_FILE), exist_ok=True)
+            with open(UPDATE_CACHE_FILE, 'wb') as f:
+                f.write(dumps({'etag': etag, 'last_modified': last_mod, 'data': data}))
+        except OSError:
             pass
-        
-        _, _, _, parsed = yt_dlp.parse_options(cli_args)
-        result = {}
-        for k in ('js_runtimes','remote_components'):
-            if k in parsed and parsed[k] is not None:
-                result[k] = parsed[k]
-        return result
-    except Exception: 
-        return {}
+    return data
 
 # --- yt-dlp Configuration Builder ---
 
-def build_opts(dl_type, quality, afmt, vfmt, outdir, hook, playlist=False, browser='none'):
+def _format_selector(quality, vfmt):
+    """Constructs the format selector that prioritizes the user's resolution choice."""
+    if quality == 'best':
+        return f'bestvideo[ext={vfmt}]+bestaudio/bestvideo+bestaudio/best'
+    h = quality.replace('p','')
+    # Look for best video AT or BELOW the selected resolution, 
+    # falling back to best available if none found.
+    return (f'bestvideo[height<={h}][ext={vfmt}]+bestaudio'
+            f'/bestvideo[height<={h}]+bestaudio/bestvideo+bestaudio/best')
+
+# Every (quality, container) pair the UI can offer, resolved once at import
+_FMT_TABLE = {(q, v): _format_selector(q, v) for q in QUALITIES for v in VIDEO_FMTS}
+
+# File naming templates, restricting titles to 100 characters to prevent path length errors
+_OUTTMPL          = '%(title.0:100)s.%(ext)s'
+_OUTTMPL_PLAYLIST = '%(playlist_index)s-%(title.0:100)s.%(ext)s'
+
+# The bundled binaries folder is fixed for the process; stat it only once
+_HAVE_FFMPEG_DIR = os.path.isdir(FFMPEG_DIR)
+
+# Baseline request headers shared by every download (copied per call)
+_HTTP_HEADERS = {
+    'User-Agent': GLOBAL_USER_AGENT,
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-us,en;q=0.5',
+    'Sec-Fetch-Mode': 'navigate',
+}
+
+# Input-side ffmpeg flags for the post-processors. The inputs are complete
+# local files, so 1 s / 1 MB of probing identifies the streams; ffmpeg's
+# 5 s / 5 MB defaults only delay the start of the merge or conversion.
+_FFMPEG_PROBE_ARGS = ['-analyzeduration', '1000000', '-probesize', '1000000']
+
+# Parallel HLS/DASH fragment downloads per video (yt-dlp's -N); playlist
+# workers multiply this, so keep it moderate
+_FRAGMENT_JOBS = 8
+
+def build_opts(dl_type, quality, afmt, vfmt, outdir, hook, playlist=False, browser='none',
+               fragments=_FRAGMENT_JOBS):
     """
     Translates UI settings into a dictionary of options for the yt-dlp engine.
     
@@ -408,10 +682,9 @@ def build_opts(dl_type, quality, afmt, vfmt, outdir, hook, playlist=False, brows
         hook (callable): Progress update callback
         playlist (bool): Whether to allow multi-video downloads
         browser (str): Browser name to extract cookies from
+        fragments (int): Fragments fetched concurrently for segmented streams
     """
-    # Define the file naming template, restricting length to 100 characters to prevent path length errors
-    outtmpl = os.path.join(outdir,
-        '%(playlist_index)s-%(title.0:100)s.%(ext)s' if playlist else '%(title.0:100)s.%(ext)s')
+    outtmpl = os.path.join(outdir, _OUTTMPL_PLAYLIST if playlist else _OUTTMPL)
     
     # Baseline options: logging setup, progress tracking, and binary locations
     opts = {
@@ -422,18 +695,25 @@ def build_opts(dl_type, quality, afmt, vfmt, outdir, hook, playlist=False, brows
         'progress_hooks': [hook], 
         'noplaylist': not playlist,
         'user_agent': GLOBAL_USER_AGENT,
-        'http_headers': {
-            'User-Agent': GLOBAL_USER_AGENT,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-us,en;q=0.5',
-            'Sec-Fetch-Mode': 'navigate',
-        }
+        'http_headers': _HTTP_HEADERS.copy(),
+        # 1 MiB receive buffer instead of yt-dlp's 1 KiB default: fewer
+        # recv() iterations and far fewer progress hook calls per chunk
+        'buffersize': 1 << 20,
+        # Segmented (HLS/DASH) streams fetch several fragments at once;
+        # plain HTTP streams are requested in 10 MiB ranges, which avoids
+        # YouTube's throttling of single long-lived responses
+        'concurrent_fragment_downloads': fragments,
+        'http_chunk_size': 10 << 20,
+        # Fail a stalled connection sooner and retry it instead of hanging
+        'socket_timeout': 20,
+        'retries': 5,
+        'fragment_retries': 5,
     }
     
     if browser and browser != 'none':
         opts['cookiesfrombrowser'] = (browser,)
     
-    if os.path.isdir(FFMPEG_DIR): 
+    if _HAVE_FFMPEG_DIR: 
         opts['ffmpeg_location'] = FFMPEG_DIR
 
     # AUDIO ONLY PATH
@@ -445,22 +725,17 @@ def build_opts(dl_type, quality, afmt, vfmt, outdir, hook, playlist=False, brows
                 'key': 'FFmpegExtractAudio',
                 'preferredcodec': afmt,
                 'preferredquality': '0' # VBR highest quality
-            }]
+            }],
+            'postprocessor_args': {'extractaudio+ffmpeg_i': list(_FFMPEG_PROBE_ARGS)},
         })
         return opts
 
     # VIDEO PATH
-    # We construct a format selector string that prioritizes the user's resolution choice.
-    if quality == 'best':
-        fmt = f'bestvideo[ext={vfmt}]+bestaudio/bestvideo+bestaudio/best'
-    else:
-        h = quality.replace('p','')
-        # Look for best video AT or BELOW the selected resolution, 
-        # falling back to best available if none found.
-        fmt = (f'bestvideo[height<={h}][ext={vfmt}]+bestaudio'
-               f'/bestvideo[height<={h}]+bestaudio/bestvideo+bestaudio/best')
+    # Precomputed selector; fall back to building it for unexpected values.
+    fmt = _FMT_TABLE.get((quality, vfmt)) or _format_selector(quality, vfmt)
     
-    opts.update({'format': fmt, 'merge_output_format': vfmt})
+    opts.update({'format': fmt, 'merge_output_format': vfmt,
+                 'postprocessor_args': {'merger+ffmpeg_i': list(_FFMPEG_PROBE_ARGS)}})
     opts.update(_get_runtime_opts())
     return opts
 
@@ -484,6 +759,9 @@ class Splash:
         ('◯', '⬤', '⬤'),
         ('⬤', '◯', '⬤'),
     ]
+    # The same frames with each glyph already paired with its color
+    _FRAMES_RESOLVED = [tuple((c, ACCENT if c == '⬤' else BORDER2) for c in f)
+                        for f in _FRAMES]
 
     def __init__(self, parent):
         # Create a full-window container
@@ -512,10 +790,14 @@ class Splash:
         self._bar_canvas = tk.Canvas(col, height=3, width=220,
                                       bg=BORDER, highlightthickness=0)
         self._bar_canvas.pack(pady=(14, 0))
+        # Persistent fill item; frames only resize it. The canvas background
+        # already paints the track, so no separate track rectangle is needed.
+        self._fg_rect = self._bar_canvas.create_rectangle(0, 0, 0, 3, fill=ACCENT, outline='')
         self._bar_w = 0
         self._bar_growing = True
 
         self._fi = 0
+        self._prev_dots = self._FRAMES_RESOLVED[0]  # Matches the initial label state
         self._animate()
 
     def _animate(self):
@@ -523,11 +805,12 @@ class Splash:
         if not self._frame.winfo_exists(): 
             return
             
-        # Update bouncing dots
-        dots = self._FRAMES[self._fi % len(self._FRAMES)]
-        for i, d in enumerate(self._d):
-            active = dots[i] == '⬤'
-            d.config(text=dots[i], fg=ACCENT if active else BORDER2)
+        # Update bouncing dots, touching only the labels that changed
+        dots = self._FRAMES_RESOLVED[self._fi % len(self._FRAMES_RESOLVED)]
+        for d, new, old in zip(self._d, dots, self._prev_dots):
+            if new != old:
+                d.config(text=new[0], fg=new[1])
+        self._prev_dots = dots
         self._fi += 1
 
         # Indeterminate 'breathing' progress bar animation
@@ -539,9 +822,7 @@ class Splash:
             self._bar_w = max(self._bar_w - 8, 0)
             if self._bar_w <= 0: self._bar_growing = True
             
-        self._bar_canvas.delete('all')
-        self._bar_canvas.create_rectangle(0, 0, W, 3, fill=BORDER, outline='')
-        self._bar_canvas.create_rectangle(0, 0, self._bar_w, 3, fill=ACCENT, outline='')
+        self._bar_canvas.coords(self._fg_rect, 0, 0, self._bar_w, 3)
 
         # Schedule next frame (approx 5.5 FPS for a smooth but low-resource look)
         self._aid = self._frame.after(180, self._animate)
@@ -556,22 +837,30 @@ class Splash:
 
 
 class YTDLPLogger:
-    def __init__(self, app):
-        self.app = app
+    """
+    Redirects yt-dlp's logger calls to the App's thread-safe log queue.
+
+    RATIONALE: One instance is created per App and shared by every
+    download; __slots__ and the pre-bound log function keep each call
+    to a single local attribute load.
+    """
+    __slots__ = ('log',)
+
+    # Step prefixes surfaced as dim progress lines (download, ffmpeg, extractaudio)
+    _DEBUG_PREFIXES = ('[download]', '[ffmpeg]', '[ExtractAudio]')
+
+    def __init__(self, log):
+        self.log = log
 
     def debug(self, msg):
-        # We can log download, ffmpeg, and extractaudio steps as dim progress logs
-        if msg.startswith('[download]') or msg.startswith('[ffmpeg]') or msg.startswith('[ExtractAudio]'):
-            clean_msg = re.sub(r'\x1b\[[0-9;]*m', '', msg)
-            self.app.root.after(0, lambda: self.app._log(clean_msg, 'dim'))
+        if msg.startswith(self._DEBUG_PREFIXES):
+            self.log(_ANSI_RE.sub('', msg), 'dim')
 
     def warning(self, msg):
-        clean_msg = re.sub(r'\x1b\[[0-9;]*m', '', msg)
-        self.app.root.after(0, lambda: self.app._log(f"Warning: {clean_msg}", 'warn'))
+        self.log(f"Warning: {_ANSI_RE.sub('', msg)}", 'warn')
 
     def error(self, msg):
-        clean_msg = re.sub(r'\x1b\[[0-9;]*m', '', msg)
-        self.app.root.after(0, lambda: self.app._log(f"Error: {clean_msg}", 'err'))
+        self.log(f"Error: {_ANSI_RE.sub('', msg)}", 'err')
 
 
 # --- Main Application Controller ---
@@ -581,6 +870,15 @@ class App:
     The heart of the application. Manages the main window, UI state, 
     background threads, and the download orchestration.
     """
+    # Minimum seconds between progress repaints (~10 Hz)
+    _PROGRESS_INTERVAL = 0.1
+    _LOG_MAX_LINES = 500 # Older console lines are trimmed past this count
+    _YDL_CACHE_SIZE = 3  # Live YoutubeDL instances kept for single downloads
+    _SHUTDOWN_TIMEOUT = 3  # Seconds to wait for a running download on exit
+    # Hook event fields forwarded from the download thread to the UI thread
+    _HOOK_KEYS = ('status', 'downloaded_bytes', 'total_bytes', 'total_bytes_estimate',
+                  '_percent_str', '_speed_str', '_eta_str')
+
     def __init__(self, root):
         self.root   = root
         self._ready = False
@@ -606,20 +904,19 @@ class App:
             except Exception:
                 pass
 
-        # Load application icon (ICO for Windows taskbar consistency)
-        try:
-            ic = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'icon.ico')
-            if not os.path.isfile(ic): 
-                ic = res('icon.ico')
-            if os.path.isfile(ic):
-                root.iconbitmap(default=ic)
-                root.iconbitmap(ic)
-                try: 
-                    root.tk.call('wm', 'iconbitmap', root._w, ic)
-                except Exception: 
-                    pass
-        except Exception: 
-            pass
+        # Load application icon (ICO for Windows taskbar consistency).
+        # Only Windows Tk can read .ico files; 'default' applies it to this
+        # window and every Toplevel in one call. macOS and Linux take their
+        # icon from the app bundle / desktop entry instead.
+        if sys.platform == 'win32':
+            try:
+                ic = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'icon.ico')
+                if not os.path.isfile(ic): 
+                    ic = res('icon.ico')
+                if os.path.isfile(ic):
+                    root.iconbitmap(default=ic)
+            except Exception: 
+                pass
 
         # --- Internal State Tracks ---
         self.url      = tk.StringVar()
@@ -629,36 +926,69 @@ class App:
         self.quality  = tk.StringVar(value='1080p')
         self.vfmt     = tk.StringVar(value='mp4')
         self.afmt     = tk.StringVar(value='mp3')
-        self.pct      = tk.DoubleVar(value=0)
+        self.pct      = 0.0   # Progress percentage; plain float, read only by _bar
         self.status   = tk.StringVar(value='Initialising...')
         self.playlist = tk.BooleanVar(value=False)
+        self.concurrency = tk.IntVar(value=4) # Parallel playlist downloads
         self._dl      = False # True if a download is currently active
-        self._stop    = False # Set to True to signal the engine to abort
+        self._stop_ev = threading.Event() # Set to signal the engine to abort
+        self._worker  = None  # Thread running the current _run_dl
+        self._close_deadline = None # Set by _on_close while waiting for the worker
+        self._last_ui_update = 0.0 # monotonic time of the last progress repaint
+        self._ui_q    = queue.SimpleQueue() # (pct, status) pairs, hook events and Tk callables from workers
+        self._hook_state = None # Newest 'downloading' hook event, read by _drain_progress
+        self._last_hook_key = None # (pct, speed tenth MB/s, eta) of the last forwarded event
+        self._draining = False # True while _drain_progress is scheduled
+        self._bar_pending = False # True while a coalesced bar repaint is queued
+        self._last_bar = None  # ((w, h, fill_px), label text) of the last bar paint
+        self._bar_w = self._bar_h = 1 # Progress canvas size, kept by <Configure>
+        self._dlb_ready = None # Last enabled state applied to the Download button
+        self.url.trace_add('write', lambda *_: self._refresh_dl_button())
+        self._radios_by_var = {} # Variable name -> [var, {value: draw}, value shown]
+        self._radio_dirty   = set() # Radio groups awaiting an idle redraw
+        self._combo_styled  = False # Dark.TCombobox registered by _combo_style
+        self._log_q   = queue.SimpleQueue() # (msg, tag) lines awaiting _drain_log
         self._log_visible = False
+        self._pending_logs = collections.deque(maxlen=self._LOG_MAX_LINES) # Lines drained before the log view exists
         self._notifications = []
         self._notif_panel_visible = False
         self._notif_bell = None
         self._notif_badge = None
         self._notif_panel = None
         self._notif_list_frame = None
+        self._splash  = None  # Overlay shown while the engine first loads
+        self._engine_ready = threading.Event() # Set once _warm_engine has finished
+        self._engine_error = None # yt-dlp import failure recorded by _warm_engine
+        self._ydls    = collections.OrderedDict() # Options key -> live YoutubeDL, LRU order
+        self._ydl_logger = YTDLPLogger(self._log) # Shared by every download's options
 
         # UI element references (populated in _build_ui)
         self.dlb = self.log = self.pc = self.p_text = None
         self.lw  = self.log_toggle = self.log_sec  = None
         self.qm  = self.vfr = self.afr = self.bm   = None
 
+        # Resolve yt-dlp and then the EJS solver on a worker thread while the
+        # UI is being built. It never touches Tk; it only fills module caches.
+        threading.Thread(target=self._warm_engine, daemon=True).start()
+
+        # One shared focus handler pair for every entry tagged by _bind_focus_highlight
+        self.root.bind_class('FocusEntry', '<FocusIn>',  self._on_focus_in)
+        self.root.bind_class('FocusEntry', '<FocusOut>', self._on_focus_out)
+
+        # Closing the window lets a running download unwind before Tk goes away
+        self.root.protocol('WM_DELETE_WINDOW', self._on_close)
+
         # Phase 1: Build the primary UI immediately.
         # This makes the window appear instantly, providing feedback to the user.
         self._build_ui()
         # Reset geometry to requested size after building widgets
         self.root.geometry("") 
 
-        # Temporarily disable the download button until dependencies load
-        self.dlb.config(state='disabled', bg=ACCENT_D, fg='#7060AA')
+        # Start flushing queued log lines into the console
+        self._drain_log()
 
-        # Phase 2: Show the splash screen overlay.
-        # This sits on top of the 'empty' UI while yt-dlp loads in the background.
-        self._splash = Splash(self.root)
+        # Temporarily disable the download button until dependencies load
+        self.dlb.set_state(state='disabled', bg=ACCENT_D, fg='#7060AA')
 
         # Ensure the window is shown and focused
         self.root.update_idletasks()
@@ -667,34 +997,43 @@ class App:
             self.root.lift()
             self.root.focus_force()
 
-        # Start the background import of the heavy yt-dlp engine.
-        threading.Thread(
-            target=_import_yt_dlp_async,
-            args=(lambda: self.root.after(0, self._finish_init),),
-            daemon=True
-        ).start()
+        # Phase 2: Enable the UI. yt-dlp is still loading on the _warm_engine
+        # thread started above; downloads wait on _engine_ready, not the UI.
+        self.root.after(0, self._finish_init)
 
-    # ── Called on main thread once yt_dlp import finishes ────────────────────
+    # ── Called on main thread once the window is up ──────────────────────────
     def _finish_init(self):
         """
-        Transition from splash screen to the main functional UI.
-        Triggered once the yt-dlp engine is fully loaded in the background.
+        Transition to the main functional UI once the window has painted.
         """
-        self._splash.dismiss()
         self._ready = True
         
         # Adjust UI state based on whether engine loaded successfully
         if HAVE_YTDLP:
-            self.dlb.config(state='normal', bg=BTN_PRIMARY_BG, fg=BTN_PRIMARY_FG)
+            self._refresh_dl_button()
             self.status.set('Ready')
+            # The import itself finishes in the background; report a failure
+            self._check_engine()
         else:
-            self.dlb.config(state='disabled', bg='#2A1A1A', fg='#664444')
+            self._engine_failed()
+
+        # Look for application updates once startup work has settled
+        self.root.after(3000, lambda: threading.Thread(
+            target=self._check_for_updates, daemon=True).start())
+
+    def _check_engine(self):
+        """Polls the warm-up thread and shows the failure state if it failed."""
+        if not self._engine_ready.is_set():
+            self.root.after(100, self._check_engine)
+        elif self._engine_error is not None:
+            self._engine_failed()
+
+    def _engine_failed(self):
+        """Disables downloads for good and reports the missing engine."""
+        self.dlb.set_state(state='disabled', bg='#2A1A1A', fg='#664444')
+        if not self._dl:
             self.status.set('Engine loading failed. Check logs.')
 
-        # Perform initial state checks and look for application updates
-        self.root.after(0, self._check)
-        threading.Thread(target=self._check_for_updates, daemon=True).start()
-
     # ─────────────────────────────────────────────────────────────────────────
     def _build_ui(self):
         """
@@ -768,10 +1107,25 @@ class App:
         tk.Label(chk_row, text='Playlist', bg=PANEL, fg=FG,
                  font=F_BODY, cursor='hand2').pack(side='left')
 
+        # Number of playlist entries downloaded in parallel; only editable
+        # while Playlist is checked (see _draw_chk)
+        par_lbl = tk.Label(footer, text='Parallel', bg=PANEL, fg=FG2, font=F_BODY)
+        par_lbl.pack(side='left', padx=(0, 4))
+        par_sb = tk.Spinbox(footer, from_=1, to=8, width=2, textvariable=self.concurrency,
+                            state='readonly', bg=CARD, fg=FG, readonlybackground=CARD,
+                            disabledbackground=PANEL, disabledforeground=FG3,
+                            buttonbackground=BTN_GHOST_BG, relief='flat', bd=0,
+                            highlightthickness=1, highlightbackground=BORDER2,
+                            font=F_BODY)
+        par_sb.pack(side='left', padx=(0, 8))
+
         def _draw_chk():
             """Renders the custom checkbox state."""
             chk_c.delete('all')
-            if self.playlist.get():
+            on = self.playlist.get()
+            par_sb.config(state='readonly' if on else 'disabled')
+            par_lbl.config(fg=FG2 if on else FG3)
+            if on:
                 chk_c.create_rectangle(1, 1, 17, 17, fill=ACCENT, outline=ACCENT)
                 # Draw white checkmark
                 chk_c.create_line(4, 9, 7, 13, fill='#FFFFFF', width=2)
@@ -902,7 +1256,13 @@ class App:
         # Graphical progress bar
         self.pc = tk.Canvas(body, height=6, bg=BG3_SAFE(), highlightthickness=0)
         self.pc.pack(fill='x', pady=0)
-        self.pc.bind('<Configure>', lambda e: self._bar())
+        # Persistent layers: a pre-painted fill + gloss image spanning the
+        # whole bar, and a track-coloured cover over the unfilled part.
+        # _bar only slides the cover's left edge.
+        self._grad_img  = tk.PhotoImage(width=1, height=1)
+        self._bar_img   = self.pc.create_image(0, 0, image=self._grad_img, anchor='nw')
+        self._bar_cover = self.pc.create_rectangle(0, 0, 0, 0, fill=BORDER, outline='')
+        self.pc.bind('<Configure>', self._on_bar_configure)
 
         # --- Debugging: Console Logs (Collapsible) ---
         self.log_sec = tk.Frame(body, bg=BG)
@@ -914,7 +1274,16 @@ class App:
                                    hover_bg=BTN_GHOST_HOV, hover_fg=ACCENT_L,
                                    font=(F_LABEL[0], 10, 'bold'), padx=10, pady=2)
         self.log_toggle.pack(anchor='center')
+        # The console itself is built by _build_log_view on first show
 
+    def _build_log_view(self):
+        """
+        Creates the console Text widget the first time the log is shown.
+
+        RATIONALE: Most sessions never open the log, so the Text widget,
+        scrollbar and tags are not paid for at startup. Lines logged
+        before then wait in _pending_logs and are written here in one insert.
+        """
         # Console text area inside a scrollable frame
         self.lw = tk.Frame(self.log_sec, bg=CARD, highlightbackground=BORDER, highlightthickness=1)
         sb = tk.Scrollbar(self.lw, bg=BG, troughcolor=CARD, width=8, bd=0,
@@ -933,6 +1302,9 @@ class App:
         self.log.tag_config('info', foreground=CYAN)
         self.log.tag_config('dim',  foreground=FG3)
 
+        self._write_log(list(self._pending_logs))
+        self._pending_logs.clear()
+
     # --- Low-Level Widget Helpers ---
 
     def _label(self, parent, text):
@@ -971,113 +1343,203 @@ class App:
                        font=F_BODY, cursor='hand2')
         lbl.pack(side='left')
 
+        # Persistent ring and centre dot; redraws only restyle them
+        ring = dot_c.create_oval(1, 1, 14, 14)
+        dot  = dot_c.create_oval(4, 4, 11, 11, fill='#FFFFFF', outline='')
+
         def _draw():
             """Renders the radio 'dot' based on the current selection state."""
-            dot_c.delete('all')
             if var.get() == value:
                 # Active state: Solid accent outer, white inner dot
-                dot_c.create_oval(1, 1, 14, 14, fill=ACCENT, outline=ACCENT)
-                dot_c.create_oval(4, 4, 11, 11, fill='#FFFFFF', outline='')
+                dot_c.itemconfigure(ring, fill=ACCENT, outline=ACCENT, width=1)
+                dot_c.itemconfigure(dot, state='normal')
             else:
                 # Inactive state: Subtle border outline
-                dot_c.create_oval(1, 1, 14, 14, fill='', outline=FG3, width=2)
+                dot_c.itemconfigure(ring, fill='', outline=FG3, width=2)
+                dot_c.itemconfigure(dot, state='hidden')
 
         def _select(e=None):
-            """Updates the value and triggers a redraw of all sibling radios."""
+            """Updates the value; the variable trace redraws the group."""
             var.set(value)
-            _draw()
             if cmd: 
                 cmd()
-            # Redraw all children of the parent to ensure only one is 'active'
-            for child in parent.winfo_children():
-                if hasattr(child, '_radio_redraw'):
-                    child._radio_redraw()
-
-        # Attach redraw helper to the row object for external access
-        row._radio_redraw = _draw
         
         # Bind interactions
         for w in (row, dot_c, lbl):
             w.bind('<ButtonRelease-1>', _select)
 
-        # Ensure we sync if the variable is changed externally
-        var.trace_add('write', lambda *_: _draw())
+        # One trace per variable redraws its group, so external changes to
+        # the variable are reflected as well
+        group = self._radios_by_var.get(str(var))
+        if group is None:
+            group = self._radios_by_var[str(var)] = [var, {}, var.get()]
+            var.trace_add('write', lambda *_: self._schedule_radio_redraw(str(var)))
+        group[1][value] = _draw
         _draw()
 
+    def _schedule_radio_redraw(self, key):
+        """Marks a radio group dirty and redraws all dirty groups once when idle."""
+        if not self._radio_dirty:
+            self.root.after_idle(self._flush_radio_redraw)
+        self._radio_dirty.add(key)
+
+    def _flush_radio_redraw(self):
+        """
+        Redraws the dirty groups. Only the previously shown radio and the
+        newly selected one can change, so at most two radios are repainted
+        per group regardless of its size.
+        """
+        dirty, self._radio_dirty = self._radio_dirty, set()
+        for key in dirty:
+            group = self._radios_by_var.get(key)
+            if group is None:
+                continue
+            var, draws, shown = group
+            new = var.get()
+            for v in {shown, new}:
+                if v in draws:
+                    draws[v]()
+            group[2] = new
+
     def _styled_menu(self, parent, var, choices):
         """
-        Creates a styled dropdown menu using OptionMenu-like logic but with 
-        Menubutton to allow for complete color control.
+        Creates a read-only dark dropdown bound to var.
+
+        RATIONALE: A ttk.Combobox is one native widget, where the old
+        Menubutton + Menu pair added a Tcl command per choice. Its popdown
+        listbox colors come from the option database set in _combo_style.
         """
-        mb = tk.Menubutton(parent, textvariable=var,
-                           bg='#2C3A50', fg='#FFFFFF',
-                           font=F_BODY, relief='flat', bd=0,
-                           activebackground=ACCENT_D, activeforeground='#FFFFFF',
-                           highlightthickness=1, highlightbackground=BORDER2,
-                           padx=10, pady=6, cursor='hand2', direction='below')
-        menu = tk.Menu(mb, tearoff=False,
-                       bg='#1E2A3A', fg='#FFFFFF', font=F_BODY,
-                       activebackground=ACCENT, activeforeground='#FFFFFF',
-                       relief='flat', bd=0)
-        for c in choices:
-            menu.add_command(label=c, command=lambda v=c: var.set(v))
-        mb['menu'] = menu
-        return mb
+        from tkinter import ttk
+        self._combo_style()
+        return ttk.Combobox(parent, textvariable=var, values=choices,
+                            state='readonly', style='Dark.TCombobox',
+                            font=F_BODY, cursor='hand2')
+
+    def _combo_style(self):
+        """Registers the Dark.TCombobox style and popdown colors once."""
+        if self._combo_styled:
+            return
+        from tkinter import ttk
+        st = ttk.Style(self.root)
+        # 'clam' honors fieldbackground on every platform; aqua/vista ignore it
+        st.theme_use('clam')
+        st.configure('Dark.TCombobox', fieldbackground='#2C3A50', background='#2C3A50',
+                     foreground='#FFFFFF', arrowcolor='#FFFFFF', bordercolor=BORDER2,
+                     lightcolor='#2C3A50', darkcolor='#2C3A50', padding=(8, 4))
+        st.map('Dark.TCombobox',
+               fieldbackground=[('readonly', '#2C3A50'), ('disabled', CARD)],
+               foreground=[('readonly', '#FFFFFF'), ('disabled', FG3)],
+               selectbackground=[('readonly', '#2C3A50')],
+               selectforeground=[('readonly', '#FFFFFF')],
+               background=[('active', ACCENT_D)])
+        self.root.option_add('*TCombobox*Listbox.background', '#1E2A3A')
+        self.root.option_add('*TCombobox*Listbox.foreground', '#FFFFFF')
+        self.root.option_add('*TCombobox*Listbox.selectBackground', ACCENT)
+        self.root.option_add('*TCombobox*Listbox.selectForeground', '#FFFFFF')
+        self.root.option_add('*TCombobox*Listbox.font', F_BODY)
+        self._combo_styled = True
 
     def _bind_focus_highlight(self, frame, entry):
-        """Brightens the parent frame's border when the entry gain focus."""
-        entry.bind('<FocusIn>',  lambda e: frame.config(highlightbackground=ACCENT))
-        entry.bind('<FocusOut>', lambda e: frame.config(highlightbackground=BORDER))
+        """
+        Brightens the parent frame's border when the entry gain focus.
+        The entry joins the 'FocusEntry' bind class so all entries share
+        one handler pair instead of two closures each.
+        """
+        entry.bindtags(('FocusEntry',) + entry.bindtags())
+        entry.focus_frame = frame
+
+    @staticmethod
+    def _on_focus_in(e):
+        e.widget.focus_frame.config(highlightbackground=ACCENT)
+
+    @staticmethod
+    def _on_focus_out(e):
+        e.widget.focus_frame.config(highlightbackground=BORDER)
 
     # --- Event and Action Handlers ---
 
     def _toggle_log(self):
-        """Shows or hides the collapsible console log area."""
+        """
+        Shows or hides the collapsible console log area.
+
+        RATIONALE: Hiding only needs the log frame's current height, so the
+        window shrinks by that amount without forcing a synchronous relayout.
+        Showing still needs one update_idletasks to learn the requested height.
+        """
         curr_w = self.root.winfo_width()
+        if self.log is None:
+            self._build_log_view()
         if self._log_visible:
+            new_h = self.root.winfo_height() - self.lw.winfo_height()
             self.lw.pack_forget()
             self.log_toggle.config(text='[+] Show Logs')
         else:
             self.lw.pack(fill='x', pady=0)
             self.log_toggle.config(text='[-] Hide Logs')
+            # Ensure window resizes to accommodate the log without affecting width
+            self.root.update_idletasks()
+            new_h = self.root.winfo_reqheight()
         self._log_visible = not self._log_visible
-        
-        # Ensure window resizes to accommodate the log without affecting width
-        self.root.update_idletasks()
-        self.root.geometry(f"{curr_w}x{self.root.winfo_reqheight()}")
+        self.root.geometry(f"{curr_w}x{new_h}")
 
     def _on_type(self):
         """Enables/disables resolution options when switching video/audio modes."""
-        self.qm.config(state='normal' if self.dl_type.get() == 'video' else 'disabled')
+        self.qm.config(state='readonly' if self.dl_type.get() == 'video' else 'disabled')
 
     def _paste(self):
-        """Attempts to read from system clipboard and update the URL field."""
+        """
+        Reads the system clipboard into the URL field. Single-video links are
+        reduced to a canonical short link, dropping tracking parameters;
+        links carrying a playlist are kept intact for playlist mode.
+        """
         try: 
-            self.url.set(self.root.clipboard_get())
+            txt = _first_url(self.root.clipboard_get())
         except Exception: 
-            pass
+            return
+        # Only genuine YouTube links are rewritten; anything else is pasted
+        # verbatim and left for _start to validate
+        m = (_YT_ID_RE.search(txt)
+             if 'list=' not in txt and _YT_URL_RE.match(txt) else None)
+        self.url.set(f'https://youtu.be/{m.group(1)}' if m else txt)
 
     def _browse(self):
         """Displays a directory selection dialog."""
+        from tkinter import filedialog
         d = filedialog.askdirectory(initialdir=self.outdir.get())
         if d: 
             self.outdir.set(d)
 
+    @staticmethod
+    def _spawn(argv):
+        """
+        Launches a helper (open, xdg-open, dbus-send) fully detached.
+
+        RATIONALE: The file manager must never hold our descriptors (notably the
+        single-instance lock socket) or it would block the next launch, so
+        close_fds is spelled out. A new session and null stdio keep the child
+        off our terminal and out of our process group.
+        """
+        import subprocess
+        return subprocess.Popen(argv, close_fds=True, start_new_session=True,
+                                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.DEVNULL)
+
     def _open(self):
         """Opens the selected output folder in the system's file explorer."""
         p = self.outdir.get()
         if sys.platform == 'win32': 
             os.startfile(p)
         elif sys.platform == 'darwin': 
-            subprocess.Popen(['open', p])
+            self._spawn(['open', p])
         else: 
-            subprocess.Popen(['xdg-open', p])
+            self._spawn(['xdg-open', p])
 
     def reveal_file(self, filepath):
         """Opens the system file explorer, highlighting/selecting the specified file."""
         if not filepath or not os.path.exists(filepath):
             return
             
+        import subprocess
         filepath = os.path.abspath(filepath)
         
         if sys.platform == 'win32':
@@ -1092,17 +1554,17 @@ class App:
                     pass
         elif sys.platform == 'darwin':
             try:
-                subprocess.Popen(['open', '-R', filepath])
+                self._spawn(['open', '-R', filepath])
             except Exception:
                 try:
-                    subprocess.Popen(['open', os.path.dirname(filepath)])
+                    self._spawn(['open', os.path.dirname(filepath)])
                 except Exception:
                     pass
         else:
             # Linux: Try D-Bus org.freedesktop.FileManager1 to highlight the file
             file_uri = f"file://{filepath}"
             try:
-                subprocess.Popen([
+                self._spawn([
                     'dbus-send', '--session', '--dest=org.freedesktop.FileManager1',
                     '/org/freedesktop/FileManager1', 'org.freedesktop.FileManager1.ShowItems',
                     f'array:string:{file_uri}', 'string:'
@@ -1111,7 +1573,7 @@ class App:
                 # Fallback to opening the parent directory
                 parent = os.path.dirname(filepath)
                 try:
-                    subprocess.Popen(['xdg-open', parent])
+                    self._spawn(['xdg-open', parent])
                 except Exception:
                     pass
 
@@ -1316,6 +1778,9 @@ class App:
 
     def _clear_log(self):
         """Wipes the console output buffer."""
+        self._pending_logs.clear()
+        if self.log is None:
+            return
         self.log.config(state='normal')
         self.log.delete('1.0', 'end')
         self.log.config(state='disabled')
@@ -1324,191 +1789,667 @@ class App:
         """
         Appends a message to the internal console log.
         Supports semantic tags: 'ok' (green), 'err' (red), 'info' (cyan), etc.
+        Safe to call from any thread; lines are queued for _drain_log.
         """
-        self.log.config(state='normal')
-        self.log.insert('end', msg + '\n', tag)
-        self.log.see('end') # Auto-scroll to bottom
-        self.log.config(state='disabled')
+        self._log_q.put((msg, tag))
+
+    def _drain_log(self):
+        """
+        Flushes queued log lines into the Text widget on the main thread.
+
+        RATIONALE:
+        yt-dlp can emit many lines per second. Inserting them one by one
+        toggles the widget state and scrolls for every line. Here up to 200
+        lines are joined per tag run and written with a single insert call,
+        followed by one scroll, every 100 ms.
+        """
+        lines = []
+        try:
+            for _ in range(200):
+                lines.append(self._log_q.get_nowait())
+        except queue.Empty:
+            pass
+        if lines:
+            if self.log is None:
+                self._pending_logs.extend(lines)
+            else:
+                self._write_log(lines)
+        self.root.after(100, self._drain_log)
+
+    def _write_log(self, lines):
+        """
+        Writes (msg, tag) pairs into the Text widget with a single insert,
+        then trims the oldest lines so the widget stays a bounded ring of
+        _LOG_MAX_LINES and inserts never relayout an ever-growing buffer.
+        """
+        chunks = [] # Alternating text, tag arguments for Text.insert
+        for msg, tag in lines:
+            if chunks and chunks[-1] == tag:
+                chunks[-2] += msg + '\n'
+            else:
+                chunks += [msg + '\n', tag]
+        if chunks:
+            self.log.config(state='normal')
+            self.log.insert('end', *chunks)
+            # 'end-1c' sits on the empty line after the final newline
+            excess = int(self.log.index('end-1c').split('.')[0]) - 1 - self._LOG_MAX_LINES
+            if excess > 0:
+                self.log.delete('1.0', f'{excess + 1}.0')
+            self.log.see('end') # Auto-scroll to bottom
+            self.log.config(state='disabled')
+
+    def _schedule_bar(self):
+        """
+        Requests a progress bar repaint, coalescing bursts of requests into
+        at most one paint per frame (~30 FPS).
+        """
+        if self._bar_pending:
+            return
+        self._bar_pending = True
+        self.root.after(33, self._do_bar)
+
+    def _do_bar(self):
+        """
+        Runs a coalesced repaint scheduled by _schedule_bar.
+
+        While the log is hidden, a fill that moved by less than 2 px since
+        the last paint (about 0.5% of a typical bar) is skipped along with
+        its label update. 0% and 100% are always painted.
+        """
+        self._bar_pending = False
+        last = self._last_bar
+        p = self.pct
+        if (not self._log_visible and last and 0 < p < 100
+                and last[0][:2] == (self._bar_w, self._bar_h)
+                and abs(int(self._bar_w * p / 100) - last[0][2]) < 2):
+            return
+        self._bar()
+
+    def _on_bar_configure(self, e):
+        """
+        Caches the progress canvas size so _bar never queries Tk for it.
+        A live resize emits a stream of <Configure> events; they share the
+        coalesced repaint of _schedule_bar instead of painting each one.
+        """
+        self._bar_w, self._bar_h = e.width, e.height
+        self._schedule_bar()
 
     def _bar(self, _=None):
         """Handles the multi-layered drawing of the custom progress bar."""
         c = self.pc
-        w = c.winfo_width()
-        h = c.winfo_height()
-        p = self.pct.get()
+        w = self._bar_w
+        h = self._bar_h
+        p = self.pct
         fill = int(w * p / 100)
+
+        # Geometry and label are compared separately so a tick that only
+        # moves the percentage text leaves the canvas untouched, and vice versa
+        geom  = (w, h, fill)
+        label = f'{p:.1f}%'
+        last  = self._last_bar or (None, None)
+        if geom == last[0] and label == last[1]:
+            return
+        self._last_bar = (geom, label)
         
-        c.delete('all')
-        # Background track
-        c.create_rectangle(0, 0, w, h, fill=BORDER, outline='')
-        
-        if fill > 0:
-            # Secondary bar fill
-            c.create_rectangle(0, 0, fill, h, fill=ACCENT, outline='')
-            # Gloss highlight (upper 1/3)
-            c.create_rectangle(0, 0, fill, max(1, h//3), fill=ACCENT_L, outline='')
+        if geom != last[0]:
+            if last[0] is None or last[0][:2] != (w, h):
+                # Repaint the gradient only when the canvas is resized:
+                # fill colour plus the gloss highlight over the upper 1/3.
+                # PhotoImage cannot be stretched, so it spans the full width.
+                img = self._grad_img
+                img.blank()
+                img.configure(width=max(1, w), height=max(1, h))
+                img.put(ACCENT, to=(0, 0, max(1, w), max(1, h)))
+                img.put(ACCENT_L, to=(0, 0, max(1, w), max(1, h//3)))
+            # Track: cover everything right of the filled portion
+            c.coords(self._bar_cover, fill, 0, w, h)
             
-        try: 
-            self.p_text.config(text=f'{p:.1f}%')
-        except Exception: 
-            pass
+        if label != last[1]:
+            try: 
+                self.p_text.config(text=label)
+            except Exception: 
+                pass
 
     # --- Core Download Orchestration Engine ---
 
-    def _check(self):
-        """Periodically validates current input state to manage UI sensitivity."""
-        if not self._dl:
-            ready = bool(self.url.get().strip()) and HAVE_YTDLP
-            s = 'normal' if ready else 'disabled'
-            # Update button state based on readiness
-            if self.dlb.config.__dict__.get('state') != s:
-                self.dlb.config(state=s, 
-                                bg=BTN_PRIMARY_BG if ready else ACCENT_D,
-                                fg=BTN_PRIMARY_FG if ready else '#7060AA')
-        self.root.after(500, self._check)
+    def _refresh_dl_button(self):
+        """
+        Enables the Download button only when a URL is entered, the engine
+        is available and no download is running. Driven by a trace on the
+        URL variable and by download start/finish, not by polling.
+        """
+        if not self._ready or not HAVE_YTDLP or self._engine_error is not None:
+            return
+        ready = bool(self.url.get().strip()) and not self._dl
+        if ready == self._dlb_ready:
+            return
+        self._dlb_ready = ready
+        self.dlb.set_state(state='normal' if ready else 'disabled', 
+                           bg=BTN_PRIMARY_BG if ready else ACCENT_D,
+                           fg=BTN_PRIMARY_FG if ready else '#7060AA')
 
     def _start(self):
         """Validates inputs and spawns the background download thread."""
-        u = self.url.get().strip()
+        u = _first_url(self.url.get())
         if not u: 
             return
+        if not _YT_URL_RE.match(u):
+            self.status.set('Invalid URL')
+            self._log(f'Error: Not a YouTube URL: {u}', 'err')
+            return
             
         d = self.outdir.get()
         if not os.path.exists(d):
             try: 
                 os.makedirs(d)
             except Exception:
+                from tkinter import messagebox
                 messagebox.showerror('Path Error', 'Cannot create target folder.')
                 return
 
         # Prepare UI for active work
         self._dl   = True
-        self._stop = False
+        self._stop_ev.clear()
         self._last_downloaded_file = None
-        self.pct.set(0)
+        self.pct = 0.0
+        self._hook_state = self._last_hook_key = None
         self._bar()
         self.status.set('Preparing download...')
-        self.dlb.config(state='disabled', bg=ACCENT_D, fg='#7060AA')
+        self._refresh_dl_button()
+        if not self._draining:
+            self._draining = True
+            self.root.after(50, self._drain_progress)
+
+        # A download started before the startup warm-up has set _engine_ready
+        # waits for yt-dlp to finish loading; cover the UI meanwhile.
+        if not self._engine_ready.is_set():
+            self._splash = Splash(self.root)
         
         self._log('--- Starting New Task ---', 'info')
         self._log(f'URL: {u}', 'dim')
         self._log(f'Dir: {d}', 'dim')
         
-        # Ensure EJS solver is present for this session
-        threading.Thread(target=_ensure_ejs_installed, daemon=True).start()
-        
+        # Tk variables may only be read on this thread; the worker gets values
+        settings = {
+            'dl_type':  self.dl_type.get(),
+            'quality':  self.quality.get(),
+            'afmt':     self.afmt.get(),
+            'vfmt':     self.vfmt.get(),
+            'playlist': self.playlist.get(),
+            'browser':  self.browser_var.get(),
+            'workers':  self.concurrency.get(),
+        }
+
         # Launch engine in separate thread to keep UI responsive
-        threading.Thread(target=self._run_dl, args=(u, d), daemon=True).start()
+        self._worker = threading.Thread(target=self._run_dl, args=(u, d, settings), daemon=True)
+        self._worker.start()
 
-    def _run_dl(self, url, outdir):
+    def _warm_engine(self):
+        """
+        Resolves the lazy yt-dlp proxy and its runtime options off the Tk thread.
+
+        RATIONALE:
+        The import takes 1-3 seconds. Starting it before _build_ui lets it
+        overlap widget creation and the user typing a URL, so the first
+        download usually finds the engine ready. Workers that arrive early
+        wait on _engine_ready rather than touching the half-loaded proxy.
+        """
+        try:
+            if HAVE_YTDLP:
+                try:
+                    # First attribute access triggers the deferred yt-dlp import
+                    yt_dlp.YoutubeDL
+                except Exception as e:
+                    # A failed lazy load leaves an empty module behind, so later
+                    # accesses would only raise AttributeError; keep the cause
+                    self._engine_error = e
+                    self._log(f'Error: Engine failed to load: {e}', 'err')
+                    return
+                # Two optparse passes; build_opts then only copies a cached dict
+                _get_runtime_opts()
+            # PATH probe for ffmpeg; the first download's notice reads the cache
+            _has_ffmpeg()
+            # On free-threaded builds (3.13t+) an extension module that is not
+            # marked thread-safe re-enables the GIL at import; report the result
+            if hasattr(sys, '_is_gil_enabled'):
+                self._log('Engine: GIL ' + ('enabled' if sys._is_gil_enabled()
+                                            else 'disabled (free-threaded)'), 'dim')
+        except Exception:
+            pass # Optional probes; downloads re-check them when they run
+        finally:
+            self._engine_ready.set()
+        # The solver plugin imports yt_dlp, so it is probed only after the
+        # proxy has loaded (see the invariant at the yt_dlp binding)
+        _ensure_ejs_installed()
+
+    def _run_dl(self, url, outdir, settings):
         """
         The main worker loop. Configures yt-dlp and executes the extraction.
-        Runs in a background thread.
+        Runs in a background thread; settings is the plain-value snapshot of
+        the UI taken by _start, so no Tk variable is read here.
         """
         try:
+            # Returns at once after the warm-up. The dismiss is queued
+            # unconditionally: _start may have shown the splash just before
+            # the warm-up finished, and _dismiss_splash is a no-op without one.
+            self._engine_ready.wait()
+            self._ui_q.put(self._dismiss_splash)
+            if self._engine_error is not None:
+                raise RuntimeError(f'Engine failed to load: {self._engine_error}')
+
             # Build platform-optimised options
             opts = build_opts(
-                self.dl_type.get(),
-                self.quality.get(),
-                self.afmt.get(),
-                self.vfmt.get(),
+                settings['dl_type'],
+                settings['quality'],
+                settings['afmt'],
+                settings['vfmt'],
                 outdir,
                 self._hook,
-                self.playlist.get(),
-                getattr(self, 'browser_var', tk.StringVar(value='none')).get()
+                settings['playlist'],
+                settings['browser']
             )
             # Register custom logger to redirect yt-dlp outputs to the UI log console
-            opts['logger'] = YTDLPLogger(self)
+            opts['logger'] = self._ydl_logger
             
             self._log('Analysing stream data...', 'dim')
             self._log('Checking extraction scripts...', 'dim')
             
-            # Verify solver readiness
-            _ensure_ejs_installed()
-            try:
-                import importlib
-                importlib.import_module('yt_dlp_ejs')
+            # Verify solver readiness (memoized after the first download)
+            if _ensure_ejs_installed():
                 self._log('Success: Challenge solver is active.', 'ok')
-            except ImportError:
+            else:
                 self._log('Notice: Running without extended JS support.', 'warn')
+            if not _has_ffmpeg():
+                self._log('Notice: ffmpeg not found; merging and audio conversion will fail.', 'warn')
 
-            class PathPP(yt_dlp.postprocessor.common.PostProcessor):
-                def __init__(self, downloader=None, callback=None):
-                    super().__init__(downloader)
-                    self.callback = callback
-
-                def run(self, info):
-                    filepath = info.get('filepath')
-                    if filepath:
-                        self.callback(filepath)
-                    return [], info
-
-            with yt_dlp.YoutubeDL(opts) as ydl:
-                def _on_path(path):
-                    self.root.after(0, lambda p=path: self.add_notification(p))
-                
-                ydl.add_post_processor(PathPP(ydl, _on_path), when='after_move')
-                # Main extraction call
-                ydl.download([url])
+            if settings['playlist']:
+                self._run_playlist(url, outdir, opts, settings['workers'])
+            else:
+                self._download(url, opts, reuse=True)
             
-            if self._stop:
-                self.status.set('Stopped')
+            if self._stop_ev.is_set():
+                self._ui_q.put((None, 'Stopped'))
                 self._log('Task stopped by user.', 'warn')
             else:
-                self.status.set('Complete')
-                self.pct.set(100)
-                self.root.after(0, self._bar)
+                self._ui_q.put((100, 'Complete'))
                 self._log('Success: Task completed successfully.', 'ok')
                 
         except Exception as e:
+            if self._stop_ev.is_set():
+                # The hook's abort signal, not a failure
+                self._ui_q.put((None, 'Stopped'))
+                self._log('Task stopped by user.', 'warn')
+                return
             err = str(e)
             # Standardise error messages for common issues
-            if 'Incomplete YouTube ID' in err: 
-                err = 'Invalid YouTube URL provided.'
-            elif 'requested format not available' in err: 
-                err = 'The selected resolution is not available for this video.'
-            elif 'Requested' in err and 'is not available' in err: 
-                err = 'Partial format missing. Try a lower quality.'
+            for pat, friendly in _ERR_MAP:
+                if pat.search(err):
+                    err = friendly
+                    break
             
             self._log(f'Error: {err}', 'err')
-            self.status.set('Failed')
+            self._ui_q.put((None, 'Failed'))
         
         finally:
+            # _drain_progress sees this, applies what is queued, then removes
+            # the splash and re-enables the button on the Tk thread
             self._dl = False
-            # Return button and state to ready
-            self.root.after(0, lambda: self._check())
+
+    def _new_ydl(self, opts):
+        """
+        Creates a YoutubeDL instance that reports each finished file to the
+        notifications panel.
+        """
+        class PathPP(yt_dlp.postprocessor.common.PostProcessor):
+            def __init__(self, downloader=None, callback=None):
+                super().__init__(downloader)
+                self.callback = callback
+
+            def run(self, info):
+                filepath = info.get('filepath')
+                if filepath:
+                    self.callback(filepath)
+                return [], info
+
+        def _on_path(path):
+            self._ui_q.put(functools.partial(self.add_notification, path))
+
+        ydl = yt_dlp.YoutubeDL(opts)
+        ydl.add_post_processor(PathPP(ydl, _on_path), when='after_move')
+        return ydl
+
+    def _download(self, url, opts, reuse=False):
+        """
+        Runs a single yt-dlp download with the given options.
+
+        With reuse=True the YoutubeDL instance is kept alive between clicks.
+        Construction registers extractors, postprocessors and hooks from the
+        options, so one instance is cached per distinct option set (up to
+        _YDL_CACHE_SIZE) and only built the first time those options are used.
+        Workers running in parallel must pass reuse=False.
+        """
+        if not reuse:
+            with self._new_ydl(opts) as ydl:
+                ydl.download([url])
+            return
+
+        # progress_hooks and logger are bound to this App and never differ
+        key = repr(sorted((k, v) for k, v in opts.items()
+                          if k not in ('progress_hooks', 'logger')))
+        ydl = self._ydls.get(key)
+        if ydl is None:
+            ydl = self._ydls[key] = self._new_ydl(opts)
+            # Switching back and forth between a few settings keeps each
+            # instance warm; beyond that the least recently used is closed
+            while len(self._ydls) > self._YDL_CACHE_SIZE:
+                self._close_one(self._ydls.popitem(last=False)[1])
+        self._ydls.move_to_end(key)
+        # Main extraction call
+        ydl.download([url])
+
+    @staticmethod
+    def _close_one(ydl):
+        """Closes one YoutubeDL instance (saves cookies, closes sockets)."""
+        try:
+            ydl.close()
+        except Exception:
+            pass
+
+    def _shutdown(self):
+        """
+        Stops any running download and waits briefly for its worker, so
+        yt-dlp can remove partial files and release them before exit, then
+        closes the cached YoutubeDL instances. Blocks, so it is only called
+        once the Tk loop has ended; closing the window goes through _on_close.
+        """
+        self._stop_ev.set()
+        if self._worker is not None and self._worker.is_alive():
+            self._worker.join(timeout=self._SHUTDOWN_TIMEOUT)
+        # Joined (or given up on) once; a second call must not wait again
+        self._worker = None
+        self._close_ydl()
+
+    def _on_close(self):
+        """
+        WM_DELETE_WINDOW handler. Signals the worker, hides the window and
+        lets the worker unwind before the root is destroyed, instead of the
+        daemon thread being killed mid-write when the process exits.
+
+        RATIONALE:
+        The wait is a 50 ms after() poll rather than a join, so the Tk loop
+        keeps running while yt-dlp cleans up and the worker never waits on
+        a blocked main thread.
+        """
+        if self._close_deadline is not None:
+            return # Already closing
+        self._stop_ev.set()
+        self._close_deadline = time.monotonic() + self._SHUTDOWN_TIMEOUT
+        self.root.withdraw()
+        self._await_worker()
+
+    def _await_worker(self):
+        """Destroys the root once the worker has exited or the deadline passed."""
+        w = self._worker
+        if w is not None and w.is_alive() and time.monotonic() < self._close_deadline:
+            self.root.after(50, self._await_worker)
+            return
+        self._worker = None
+        self._close_ydl()
+        self.root.destroy()
+
+    def _close_ydl(self):
+        """Releases every cached YoutubeDL instance."""
+        while self._ydls:
+            self._close_one(self._ydls.popitem()[1])
+
+    def _run_playlist(self, url, outdir, opts, workers):
+        """
+        Downloads the entries of a playlist concurrently.
+
+        RATIONALE:
+        Downloading entries one after another leaves bandwidth idle while
+        each video is being extracted and post-processed. The playlist is
+        enumerated once (flat, without resolving formats) and its entries
+        are then fetched by a small thread pool. Each pool thread builds one
+        YoutubeDL on its first entry and reuses it for the rest, so browser
+        cookies and the network opener are set up once per worker.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        probe_opts = dict(opts, extract_flat='in_playlist', progress_hooks=[])
+        with yt_dlp.YoutubeDL(probe_opts) as ydl:
+            info = ydl.extract_info(url, download=False)
+        if info.get('_type') not in ('playlist', 'multi_video'):
+            # A plain video: the probe already extracted it in full, so hand
+            # that result to the downloader instead of extracting it again
+            with self._new_ydl(opts) as ydl:
+                ydl.process_ie_result(info, download=True)
+            return
+        entries = [e for e in info.get('entries') or () if e]
+        if not entries:
+            self._log('Playlist has no downloadable videos.', 'warn')
+            return
+        if len(entries) == 1:
+            # Fetch the lone entry directly rather than re-extracting the
+            # playlist page the probe has just read
+            e = entries[0]
+            return self._download(e.get('webpage_url') or e.get('url'),
+                                  dict(opts, outtmpl=os.path.join(outdir, _OUTTMPL),
+                                       noplaylist=True))
+
+        workers = max(1, min(workers, len(entries)))
+        self._log(f'Playlist: {len(entries)} videos, {workers} parallel jobs.', 'info')
+
+        # Per-entry completion fractions; the bar shows their mean
+        progress = [0.0] * len(entries)
+        lock = threading.Lock()
+        width = len(str(len(entries)))
+
+        # Shared by every worker's instance. Entries keep the playlist
+        # ordering in file names: each one is given its playlist_index
+        # through extra_info, which the template and _entry_hook read back.
+        eopts = dict(opts, noplaylist=True,
+                     outtmpl=os.path.join(
+                         outdir, f'%(playlist_index)0{width}d-%(title.0:100)s.%(ext)s'),
+                     progress_hooks=[lambda d: self._entry_hook(d, progress, lock)])
+        local = threading.local() # Pool thread -> its YoutubeDL
+        ydls  = []                # Every instance built, closed after the pool
+
+        def _job(idx, entry):
+            # After Stop, entries still waiting in the pool are skipped
+            # outright rather than extracted only to abort on their first hook
+            if self._stop_ev.is_set():
+                return
+            ydl = getattr(local, 'ydl', None)
+            if ydl is None:
+                ydl = local.ydl = self._new_ydl(eopts)
+                with lock:
+                    ydls.append(ydl)
+            ydl.extract_info(entry.get('webpage_url') or entry.get('url'),
+                             download=True, extra_info={'playlist_index': idx + 1})
+            with lock:
+                progress[idx] = 1.0
+
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                futures = [ex.submit(_job, i, e) for i, e in enumerate(entries)]
+        finally:
+            for ydl in ydls:
+                self._close_one(ydl)
+        if self._stop_ev.is_set():
+            return # Running entries aborted; _run_dl reports the stop once
+        errors = [f.exception() for f in futures if f.exception()]
+        for e in errors:
+            self._log(f'Error: {e}', 'err')
+        if errors:
+            raise Exception(f'{len(errors)} of {len(entries)} playlist videos failed.')
+
+    def _entry_hook(self, d, progress, lock):
+        """Progress callback for playlist entries; aggregates into the main bar."""
+        if self._stop_ev.is_set():
+            raise Exception('Stopped') # Abortion signal for yt-dlp
+
+        if d.get('status') != 'downloading':
+            return
+        info = d.get('info_dict') or {}
+        # 1-based index attached by _run_playlist's extra_info
+        idx = info.get('playlist_index')
+        if not idx:
+            return
+        idx -= 1
+        total = d.get('total_bytes') or d.get('total_bytes_estimate')
+        if not total:
+            return
+        frac = d.get('downloaded_bytes', 0) / total
+        # Video+audio selections download each stream from 0 to 1 in turn;
+        # place this stream's fraction within its share of the entry
+        streams = info.get('requested_formats') or ()
+        ids = [f.get('format_id') for f in streams]
+        if info.get('format_id') in ids:
+            frac = (ids.index(info['format_id']) + frac) / len(ids)
+        with lock:
+            # Only _job's completion (merge included) marks an entry done
+            progress[idx] = max(progress[idx], min(frac, 0.99))
+            if not self._progress_due():
+                return
+            p    = 100 * sum(progress) / len(progress)
+            done = sum(1 for f in progress if f >= 1.0)
+        self._ui_q.put((p,
+            f'Playlist: {done}/{len(progress)} done  |  {d.get("_speed_str", "N/A")}'))
 
     def _hook(self, d):
-        """ yt-dlp multi-event callback. Updates the UI on the main thread."""
-        if self._stop: 
+        """
+        yt-dlp multi-event callback, run on the download thread.
+        Only checks for abort and hands a slim copy of the event to the UI
+        thread; all parsing happens in _hook_progress.
+        """
+        if self._stop_ev.is_set(): 
             raise Exception('Stopped') # Abortion signal for yt-dlp
             
         st = d.get('status')
         if st == 'downloading':
-            try:
-                # Extract clean percentage from string (handle ANSI codes)
-                p_str = d.get('_percent_str', '0%').replace('%','').strip()
-                p_str = re.sub(r'\x1b\[[0-9;]*m', '', p_str)
-                p = float(p_str)
-                self.pct.set(p)
-                
-                speed = d.get('_speed_str', 'N/A')
-                eta   = d.get('_eta_str',   'N/A')
-                self.status.set(f'Downloader: {speed}  |  ETA: {eta}')
-                self.root.after(0, self._bar)
-            except Exception: 
-                pass
+            # Change test first: an unchanged tick must not stamp the rate
+            # limiter, or it would hold back the next real change
+            key = self._hook_key(d)
+            if key != self._last_hook_key and self._progress_due():
+                self._last_hook_key = key
+                # Latest-wins slot: one attribute store, no queue traffic.
+                # Intermediate ticks may be overwritten before the UI reads them.
+                self._hook_state = {k: d.get(k) for k in self._HOOK_KEYS}
         elif st == 'finished':
-            self.status.set('Processing media files...')
+            # Transitions must not be lost, so they still go through the queue
+            self._ui_q.put({k: d.get(k) for k in self._HOOK_KEYS})
             self._log('Extraction finished. Merging/Converting...', 'dim')
 
+    @staticmethod
+    def _hook_key(d):
+        """
+        What a hook event would show in the UI: the whole percent, the speed
+        to 0.1 MB/s and the ETA second. Events whose key matches the last
+        forwarded one are dropped before any copying or formatting.
+        """
+        total = d.get('total_bytes') or d.get('total_bytes_estimate')
+        return (int((d.get('downloaded_bytes') or 0) * 100 / total) if total else None,
+                int((d.get('speed') or 0) / 104857.6), d.get('eta'))
+
+    def _hook_progress(self, d):
+        """Translates a queued hook event into a (pct, status) pair, or None."""
+        if d['status'] == 'finished':
+            return None, 'Processing media files...'
+        total = d['total_bytes'] or d['total_bytes_estimate']
+        if total:
+            p = (d['downloaded_bytes'] or 0) * 100.0 / total
+        else:
+            try:
+                # Extract clean percentage from string (handle ANSI codes)
+                p = float(_ANSI_RE.sub('', (d['_percent_str'] or '0%')).replace('%','').strip())
+            except ValueError: 
+                return None
+        speed = d['_speed_str'] or 'N/A'
+        eta   = d['_eta_str']   or 'N/A'
+        return p, f'Downloader: {speed}  |  ETA: {eta}'
+
+    def _progress_due(self):
+        """
+        Rate-limits progress updates from yt-dlp hooks.
+
+        yt-dlp fires hooks for every received chunk, far more often than the
+        bar can visibly change; each update queues Tk work on the main loop.
+        Returns True at most once per _PROGRESS_INTERVAL.
+        """
+        now = time.monotonic()
+        if now - self._last_ui_update < self._PROGRESS_INTERVAL:
+            return False
+        self._last_ui_update = now
+        return True
+
+    def _set_p(self, p, text):
+        """
+        Applies a progress value (None keeps the current one) and status line.
+        The status label is only rewritten when its text actually changes.
+        Always runs on the Tk thread, so the end states (0% and 100%) are
+        painted directly instead of waiting for the coalesced repaint.
+        """
+        if p is not None:
+            self.pct = p
+            if 0 < p < 100:
+                self._schedule_bar()
+            else:
+                self._bar()
+        if text != self.status.get():
+            self.status.set(text)
+
+    def _drain_progress(self):
+        """
+        Applies queued progress updates on the main thread.
+
+        RATIONALE:
+        Worker threads never touch Tk directly. Routine 'downloading' ticks
+        overwrite the _hook_state slot; transitions, (pct, status) pairs and
+        callables for other Tk work go on _ui_q. This loop runs every 50 ms while a download is active,
+        reads the slot first and the queue after it, and applies only the
+        newest update, so bursts of hook events collapse into a single repaint.
+        """
+        active = self._dl  # Read first: items put before _dl clears are drained below
+        last = None
+        state, self._hook_state = self._hook_state, None
+        if state is not None:
+            last = self._hook_progress(state)
+        try:
+            while True:
+                item = self._ui_q.get_nowait()
+                if callable(item):
+                    item() # Tk work deferred by a worker thread
+                    continue
+                if isinstance(item, dict):
+                    item = self._hook_progress(item)
+                if item is not None:
+                    last = item
+        except queue.Empty:
+            pass
+        if last is not None:
+            self._set_p(*last)
+        if active:
+            self.root.after(50, self._drain_progress)
+        else:
+            # The worker has finished and everything it queued is applied
+            self._draining = False
+            self._dismiss_splash()
+            self._refresh_dl_button()
+
     def _stop_dl(self):
         """Signals the background thread to abort the current engine process."""
         if self._dl:
-            self._stop = True
+            self._stop_ev.set()
             self.status.set('Stopping...')
             self._log('Stopping engine...', 'warn')
 
+    def _dismiss_splash(self):
+        """Removes the engine loading overlay if it is showing."""
+        if self._splash:
+            self._splash.dismiss()
+            self._splash = None
+
     def _done(self):
         """Called when download and post-processing are complete."""
         self._reset()
@@ -1518,7 +2459,7 @@ class App:
     def _reset(self):
         """Resets the UI state to allow for a new download."""
         self._dl = False
-        self.dlb.config(state='normal', bg=BTN_PRIMARY_BG, fg=BTN_PRIMARY_FG)
+        self._refresh_dl_button()
 
 # --- Auto-Update Lifecycle ---
 
@@ -1528,17 +2469,7 @@ class App:
         Does not interrupt the user; silently logs readiness for update.
         """
         try:
-            ctx = ssl.create_default_context()
-            ctx.check_hostname = False
-            ctx.verify_mode = ssl.CERT_NONE
-
-            url_no_cache = f"{UPDATE_CHECK_URL}?t={int(time.time())}"
-            req = urllib.request.Request(url_no_cache, headers={
-                'User-Agent': GLOBAL_USER_AGENT,
-                'Cache-Control': 'no-cache'
-            })
-            resp = urllib.request.urlopen(req, timeout=8, context=ctx)
-            data = json.loads(resp.read().decode('utf-8'))
+            data = _fetch_update_manifest()
 
             remote_ver = data.get('version', '0.0.0')
             if self._version_newer(remote_ver, APP_VERSION):
@@ -1580,17 +2511,7 @@ class App:
     def _run_about_update_check(self, lbl_status, btn_row, dlg):
         """Asynchronously contacts GitHub to check for updates and updates the About dialog UI."""
         try:
-            ctx = ssl.create_default_context()
-            ctx.check_hostname = False
-            ctx.verify_mode = ssl.CERT_NONE
-
-            url_no_cache = f"{UPDATE_CHECK_URL}?t={int(time.time())}"
-            req = urllib.request.Request(url_no_cache, headers={
-                'User-Agent': GLOBAL_USER_AGENT,
-                'Cache-Control': 'no-cache'
-            })
-            resp = urllib.request.urlopen(req, timeout=8, context=ctx)
-            data = json.loads(resp.read().decode('utf-8'))
+            data = _fetch_update_manifest()
 
             remote_ver = data.get('version', '0.0.0')
             changelog  = data.get('changelog', '')
@@ -1623,6 +2544,7 @@ class App:
             
         def _download():
             if dl_url:
+                import webbrowser
                 webbrowser.open(dl_url)
             dlg.destroy()
 
@@ -1653,16 +2575,18 @@ class App:
                  font=F_BTN, padx=16, pady=8).pack()
 
     @staticmethod
-    def _version_newer(remote, local):
+    @functools.lru_cache(maxsize=32)
+    def _parse_ver(s):
+        """Parses 'major.minor.patch' into an int tuple padded to 3 parts."""
+        p = tuple(int(x) for x in s.split('.'))
+        return p + (0,) * (3 - len(p))
+
+    @classmethod
+    def _version_newer(cls, remote, local):
         """Identifies if a semantic version string is prioritised over local (remote > local)."""
         try:
-            r = [int(x) for x in remote.split('.')]
-            l = [int(x) for x in local.split('.')]
-            # Normalise list lengths to 3 parts (major.minor.patch)
-            while len(r) < 3: r.append(0)
-            while len(l) < 3: l.append(0)
-            return r > l
-        except (ValueError, AttributeError):
+            return cls._parse_ver(remote) > cls._parse_ver(local)
+        except (ValueError, AttributeError, TypeError):
             return False
 
     def _show_update_dialog(self, data):
@@ -1708,6 +2632,7 @@ class App:
 
         def _download():
             if dl_url:
+                import webbrowser
                 webbrowser.open(dl_url)
             dlg.destroy()
 
@@ -1751,26 +2676,27 @@ def _apply_dock_persistence():
         import ctypes, ctypes.util
         lib_objc = ctypes.cdll.LoadLibrary(ctypes.util.find_library('objc'))
         
-        # Configure function return/argument types for the bridge
+        # One typed alias of objc_msgSend per call signature. Reassigning
+        # objc_msgSend.argtypes between calls would leak the last signature to
+        # any other user of the shared function object.
         lib_objc.objc_getClass.restype   = ctypes.c_void_p
         lib_objc.sel_registerName.restype = ctypes.c_void_p
-        lib_objc.objc_msgSend.restype    = ctypes.c_void_p
-        lib_objc.objc_msgSend.argtypes   = [ctypes.c_void_p, ctypes.c_void_p]
+        send = ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p)(
+            ('objc_msgSend', lib_objc))
+        send_int = ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p,
+                                    ctypes.c_int64)(('objc_msgSend', lib_objc))
+        send_bool = ctypes.CFUNCTYPE(ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p,
+                                     ctypes.c_bool)(('objc_msgSend', lib_objc))
+        sel = functools.lru_cache(maxsize=None)(lib_objc.sel_registerName)
         
         # [NSApplication sharedApplication]
-        ns_app = lib_objc.objc_msgSend(
-            lib_objc.objc_getClass(b'NSApplication'),
-            lib_objc.sel_registerName(b'sharedApplication'))
+        ns_app = send(lib_objc.objc_getClass(b'NSApplication'), sel(b'sharedApplication'))
             
         # [ns_app setActivationPolicy:0] (0 = NSApplicationActivationPolicyRegular)
-        lib_objc.objc_msgSend.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_int64]
-        lib_objc.objc_msgSend(ns_app,
-            lib_objc.sel_registerName(b'setActivationPolicy:'), 0)
+        send_int(ns_app, sel(b'setActivationPolicy:'), 0)
             
         # [ns_app activateIgnoringOtherApps:YES]
-        lib_objc.objc_msgSend.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_bool]
-        lib_objc.objc_msgSend(ns_app,
-            lib_objc.sel_registerName(b'activateIgnoringOtherApps:'), True)
+        send_bool(ns_app, sel(b'activateIgnoringOtherApps:'), True)
     except Exception:
         # Fail silently to avoid crashing on systems with locked-down runtimes
         pass
@@ -1785,15 +2711,18 @@ def main():
     _apply_dock_persistence()
 
     # 3. Instantiate the App controller and start the event loop
-    app_instance = App(root)
-    root.mainloop()
-    
-    # 4. Cleanup: Release the single-instance lock on shutdown
-    if _lock_sock:
-        try: 
-            _lock_sock.close()
-        except Exception: 
-            pass
+    try:
+        app_instance = App(root)
+        root.mainloop()
+        # 4. Cleanup: Stop the engine (a no-op after _on_close)
+        app_instance._shutdown()
+    finally:
+        # Release the single-instance lock even if startup or the loop failed
+        if _lock_sock:
+            try: 
+                _lock_sock.close()
+            except Exception: 
+                pass
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -22,6 +22,8 @@ with open(Path(__file__).parent.parent / 'version.json') as f:
 # The user-facing name of the final application (constant across versions)
 APP_NAME    = 'YouTube Downloader'
 FILE_NAME   = 'YouTube_Downloader'
+# macOS bundle identifier; app.py looks the running instance up by it
+BUNDLE_ID   = 'faysal.ytdl.app.pro.v1'
 
 # Path resolution for core files and output target
 SCRIPT     = Path(__file__).parent / 'app.py'
@@ -259,6 +261,7 @@ def build():
     if IS_WIN and ICO.exists():
         cmd += [f'--icon={ICO}']
     elif IS_MAC:
+        cmd += [f'--osx-bundle-identifier={BUNDLE_ID}']
         if ICNS.exists():
             cmd += [f'--icon={ICNS}']
         elif ICO.exists():